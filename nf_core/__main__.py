@@ -14,7 +14,6 @@ import rich_click as click
 from trogon import tui
 
 from nf_core import __version__
-from nf_core.download import DownloadError
 from nf_core.modules.modules_repo import NF_CORE_MODULES_REMOTE
 from nf_core.params_file import ParamsFileBuilder
 from nf_core.utils import check_if_outdated, rich_force_colors, setup_nfcore_dir
@@ -93,6 +92,9 @@ rich.traceback.install(console=stderr, width=200, word_wrap=True, extra_lines=1)
 # because they are actually preliminary, but intended program terminations.
 # (Custom exceptions are cleaner than `sys.exit(1)`, which we used before)
 def selective_traceback_hook(exctype, value, traceback):
+    # Imported here so that commands other than 'download' don't pay for importing it
+    from nf_core.download import DownloadError
+
     if exctype in {DownloadError}:  # extend set as needed
         log.error(value)
     else:
@@ -1293,7 +1295,8 @@ def modules_lint(ctx, tool, dir, registry, key, all, fail_warned, local, passed,
     default=".",
     help=r"Pipeline directory. [dim]\[default: Current working directory][/]",
 )
-def modules_info(ctx, tool, dir):
+@click.option("--no-validate", is_flag=True, default=False, help="Don't check the structure of the meta.yml file")
+def modules_info(ctx, tool, dir, no_validate):
     """
     Show developer usage information about a given module.
 
@@ -1314,6 +1317,7 @@ def modules_info(ctx, tool, dir):
             ctx.obj["modules_repo_url"],
             ctx.obj["modules_repo_branch"],
             ctx.obj["modules_repo_no_pull"],
+            validate=not no_validate,
         )
         stdout.print(module_info.get_component_info())
     except (UserWarning, LookupError) as e:
@@ -1626,7 +1630,8 @@ def subworkflows_lint(ctx, subworkflow, dir, registry, key, all, fail_warned, lo
     default=".",
     help=r"Pipeline directory. [dim]\[default: Current working directory][/]",
 )
-def subworkflows_info(ctx, subworkflow, dir):
+@click.option("--no-validate", is_flag=True, default=False, help="Don't check the structure of the meta.yml file")
+def subworkflows_info(ctx, subworkflow, dir, no_validate):
     """
     Show developer usage information about a given subworkflow.
 
@@ -1647,6 +1652,7 @@ def subworkflows_info(ctx, subworkflow, dir):
             ctx.obj["modules_repo_url"],
             ctx.obj["modules_repo_branch"],
             ctx.obj["modules_repo_no_pull"],
+            validate=not no_validate,
         )
         stdout.print(subworkflow_info.get_component_info())
     except (UserWarning, LookupError) as e:
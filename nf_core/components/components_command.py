@@ -1,19 +1,148 @@
+import concurrent.futures
 import logging
 import mmap
 import os
 import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import nf_core.utils
 from nf_core.modules.modules_json import ModulesJson
 from nf_core.modules.modules_repo import ModulesRepo
 
-from .components_utils import get_repo_info
+from .components_utils import get_repo_info, load_yaml_cached
 
 log = logging.getLogger(__name__)
 
 
+# The component directories found under a base directory, with the modification time of every scanned directory
+_component_dirs_cache: Dict[str, Tuple[Tuple[str, ...], Tuple[Tuple[str, int], ...]]] = {}
+
+# Only directories with at least this many files are unlinked from a thread pool
+_PARALLEL_UNLINK_MIN_FILES = 64
+
+
+def _iter_component_dirs(
+    base_dir: Union[str, Path], scanned_dirs: Optional[List[Tuple[str, int]]] = None
+) -> Iterator[str]:
+    """
+    Yield the paths, relative to `base_dir`, of all directories containing a 'main.nf' file.
+
+    Component directories are not descended into any further, so the
+    test and template folders of each module/subworkflow are never scanned.
+
+    Args:
+        base_dir (str | Path): The directory to start the search from
+        scanned_dirs ([(str, int)], optional): If given, the path and modification time
+            of every directory that could be listed are appended to it
+    """
+    base_dir = os.fspath(base_dir)
+    # Paths are built from `base_dir`, so the relative path is everything after this prefix
+    prefix_len = len(os.path.join(base_dir, ""))
+    dirs_to_scan = [base_dir]
+    while dirs_to_scan:
+        directory = dirs_to_scan.pop()
+        child_dirs = []
+        has_main_nf = False
+        try:
+            # Stat before listing, so that a change made during the scan invalidates it
+            mtime = os.stat(directory).st_mtime_ns if scanned_dirs is not None else 0
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        child_dirs.append(entry.path)
+                    elif entry.name == "main.nf":
+                        # The rest of the directory is irrelevant once we know it is a component
+                        has_main_nf = True
+                        break
+        except OSError:
+            # Mirror os.walk, which silently skips directories it cannot read
+            continue
+        if scanned_dirs is not None:
+            scanned_dirs.append((directory, mtime))
+        if has_main_nf:
+            yield directory[prefix_len:] or "."
+        else:
+            # Reversed so that the directories are visited in the order they were listed
+            dirs_to_scan.extend(reversed(child_dirs))
+
+
+def _scan_component_dirs(base_dir: Union[str, Path]) -> Tuple[str, ...]:
+    """
+    Get the paths, relative to `base_dir`, of all directories containing a 'main.nf' file.
+
+    The result is reused for as long as none of the scanned directories has been modified.
+    It is not cached if `base_dir` itself could not be listed, e.g. because it doesn't exist yet.
+
+    Args:
+        base_dir (str | Path): The directory to start the search from
+    """
+    base_dir = os.fspath(base_dir)
+    if base_dir in _component_dirs_cache:
+        component_dirs, dir_mtimes = _component_dirs_cache[base_dir]
+        try:
+            if all(os.stat(directory).st_mtime_ns == mtime for directory, mtime in dir_mtimes):
+                return component_dirs
+        except OSError:
+            pass
+    scanned_dirs: List[Tuple[str, int]] = []
+    component_dirs = tuple(_iter_component_dirs(base_dir, scanned_dirs))
+    # `base_dir` is always the first directory scanned, so nothing is recorded if it couldn't be listed
+    if scanned_dirs:
+        _component_dirs_cache[base_dir] = (component_dirs, tuple(scanned_dirs))
+    else:
+        _component_dirs_cache.pop(base_dir, None)
+    return component_dirs
+
+
+def _fast_rmtree(path: Union[str, Path]) -> None:
+    """
+    Remove a directory and all of its contents.
+
+    Uses the file type cached by os.scandir for each entry, so files are
+    unlinked without an extra stat call. The files of each directory are
+    unlinked right after it is listed. Directories with many files are
+    unlinked from a few threads, which mostly helps on network filesystems.
+
+    Args:
+        path (str | Path): The directory to remove
+
+    Raises:
+        OSError: If the path is a symbolic link, like shutil.rmtree does
+    """
+    if os.path.islink(path):
+        raise OSError(f"Cannot remove the symbolic link '{path}' as a directory")
+    dirs_to_scan = [os.fspath(path)]
+    dirs_to_remove = []
+    executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    try:
+        while dirs_to_scan:
+            directory = dirs_to_scan.pop()
+            dirs_to_remove.append(directory)
+            files_to_remove = []
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs_to_scan.append(entry.path)
+                    else:
+                        files_to_remove.append(entry.path)
+            if len(files_to_remove) < _PARALLEL_UNLINK_MIN_FILES:
+                for file_path in files_to_remove:
+                    os.unlink(file_path)
+                continue
+            if executor is None:
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+            # Consume the results so that the first error is raised
+            for _ in executor.map(os.unlink, files_to_remove):
+                pass
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    # Subdirectories are always listed after their parent directory
+    for directory in reversed(dirs_to_remove):
+        os.rmdir(directory)
+
+
 class ComponentCommand:
     """
     Base class for the 'nf-core modules' and 'nf-core subworkflows' commands
@@ -34,11 +163,24 @@ class ComponentCommand:
         """
         self.component_type = component_type
         self.dir = dir
-        self.modules_repo = ModulesRepo(remote_url, branch, no_pull, hide_progress)
+        # The modules repo is only cloned/updated when a command first needs it
+        self._modules_repo: Optional[ModulesRepo] = None
+        self._modules_repo_args = (remote_url, branch, no_pull, hide_progress)
+        # Other ModulesRepo objects created before that should still respect the user's choice
+        ModulesRepo.no_pull_global |= no_pull
         self.hide_progress = hide_progress
         self.no_prompts = no_prompts
         self._configure_repo_and_paths()
 
+    @property
+    def modules_repo(self) -> ModulesRepo:
+        """
+        The ModulesRepo object for the remote, set up on first access
+        """
+        if self._modules_repo is None:
+            self._modules_repo = ModulesRepo(*self._modules_repo_args)
+        return self._modules_repo
+
     def _configure_repo_and_paths(self, nf_dir_req: bool = True) -> None:
         """
         Determine the repo type and set some default paths.
@@ -68,10 +210,10 @@ class ComponentCommand:
         """
         Get the local modules/subworkflows in a pipeline
         """
-        local_component_dir = Path(self.dir, self.component_type, "local")
-        return [
-            str(path.relative_to(local_component_dir)) for path in local_component_dir.iterdir() if path.suffix == ".nf"
-        ]
+        local_component_dir = os.path.join(self.dir, self.component_type, "local")
+        # The directory is flat, so the entry names are already the relative paths
+        with os.scandir(local_component_dir) as entries:
+            return [entry.name for entry in entries if entry.name.endswith(".nf") and entry.is_file()]
 
     def get_components_clone_modules(self) -> List[str]:
         """
@@ -81,11 +223,7 @@ class ComponentCommand:
             component_base_path = Path(self.dir, self.default_modules_path)
         elif self.component_type == "subworkflows":
             component_base_path = Path(self.dir, self.default_subworkflows_path)
-        return [
-            str(Path(dir).relative_to(component_base_path))
-            for dir, _, files in os.walk(component_base_path)
-            if "main.nf" in files
-        ]
+        return list(_scan_component_dirs(component_base_path))
 
     def has_valid_directory(self) -> bool:
         """Check that we were given a pipeline or clone of nf-core/modules"""
@@ -120,7 +258,12 @@ class ComponentCommand:
         """
 
         try:
-            shutil.rmtree(component_dir)
+            try:
+                _fast_rmtree(component_dir)
+            except OSError as e:
+                log.debug(f"Falling back to shutil.rmtree to remove '{component_dir}': {e}")
+                shutil.rmtree(component_dir)
+            _component_dirs_cache.clear()
             # remove all empty directories
             for dir_path, dir_names, filenames in os.walk(self.dir, topdown=False):
                 if not dir_names and not filenames:
@@ -151,9 +294,7 @@ class ComponentCommand:
         if not repo_dir.exists():
             raise LookupError(f"Nothing installed from {install_dir} in pipeline")
 
-        return [
-            str(Path(dir_path).relative_to(repo_dir)) for dir_path, _, files in os.walk(repo_dir) if "main.nf" in files
-        ]
+        return list(_scan_component_dirs(repo_dir))
 
     def install_component_files(
         self, component_name: str, component_version: str, modules_repo: ModulesRepo, install_dir: str
@@ -170,8 +311,32 @@ class ComponentCommand:
         Returns:
             (bool): Whether the operation was successful of not
         """
+        _component_dirs_cache.clear()
         return modules_repo.install_component(component_name, install_dir, component_version, self.component_type)
 
+    def _load_yamls(self, paths: List[Union[str, Path]]) -> Dict[str, Any]:
+        """
+        Load several YAML files (e.g. the meta.yml of each module) in parallel
+
+        Args:
+            paths ([str | Path]): The paths of the YAML files
+
+        Returns:
+            (dict): The parsed contents of each file, keyed by its path. Files that don't exist are left out.
+        """
+
+        def _load_yaml(path: Union[str, Path]) -> Optional[Any]:
+            try:
+                return load_yaml_cached(path)
+            except FileNotFoundError:
+                return None
+
+        if not paths:
+            return {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+            contents = pool.map(_load_yaml, paths)
+            return {str(path): content for path, content in zip(paths, contents) if content is not None}
+
     def load_lint_config(self) -> None:
         """Parse a pipeline lint config file.
 
@@ -193,13 +358,15 @@ class ComponentCommand:
         """
         if self.repo_type == "pipeline":
             wrong_location_modules: List[Path] = []
-            for directory, _, files in os.walk(Path(self.dir, "modules")):
-                if "main.nf" in files:
-                    module_path = Path(directory).relative_to(Path(self.dir, "modules"))
-                    parts = module_path.parts
-                    # Check that there are modules installed directly under the 'modules' directory
-                    if parts[1] == "modules":
-                        wrong_location_modules.append(module_path)
+            modules_dir = Path(self.dir, "modules")
+            if modules_dir.is_dir():
+                with os.scandir(modules_dir) as install_dirs:
+                    install_dir_names = [entry.name for entry in install_dirs if entry.is_dir()]
+                # Only look for modules installed under an additional 'modules' directory,
+                # instead of scanning every module in the pipeline
+                for install_dir in install_dir_names:
+                    for directory in _iter_component_dirs(Path(modules_dir, install_dir, "modules")):
+                        wrong_location_modules.append(Path(install_dir, "modules", directory))
             # If there are modules installed in the wrong location
             if len(wrong_location_modules) > 0:
                 log.info("The modules folder structure is outdated. Reinstalling modules.")
@@ -20,6 +20,9 @@ from nf_core.components.components_command import ComponentCommand
 
 log = logging.getLogger(__name__)
 
+# Container software that can be chosen to run the tests with when $PROFILE is not set
+CONTAINER_PROFILE_CHOICES = ("Docker", "Singularity", "Conda")
+
 
 class ComponentsTest(ComponentCommand):  # type: ignore[misc]
     """
@@ -108,6 +111,7 @@ class ComponentsTest(ComponentCommand):  # type: ignore[misc]
             self.check_modules_structure()
 
         # Get the component name if not specified
+        selected_from_installed = False
         if self.component_name is None:
             if self.no_prompts:
                 raise UserWarning(
@@ -115,18 +119,23 @@ class ComponentsTest(ComponentCommand):  # type: ignore[misc]
                 )
             else:
                 try:
+                    installed_components = frozenset(self.components_from_repo(self.org))
                     self.component_name = questionary.autocomplete(
                         "Tool name:" if self.component_type == "modules" else "Subworkflow name:",
-                        choices=self.components_from_repo(self.org),
+                        choices=sorted(installed_components),
                         style=nf_core.utils.nfcore_question_style,
                     ).unsafe_ask()
                 except LookupError:
                     raise
+                # The directory of a component picked from the list was just found, as long as the remote uses the same org path
+                selected_from_installed = (
+                    self.component_name in installed_components and self.modules_repo.repo_path == self.org
+                )
 
         self.component_dir = Path(self.component_type, self.modules_repo.repo_path, *self.component_name.split("/"))
 
         # First, sanity check that the module directory exists
-        if not Path(self.dir, self.component_dir).is_dir():
+        if not selected_from_installed and not os.path.isdir(os.path.join(self.dir, self.component_dir)):
             raise UserWarning(
                 f"Cannot find directory '{self.component_dir}'.{' Should be TOOL/SUBTOOL or TOOL' if self.component_type == 'modules' else ''}"
             )
@@ -145,12 +154,16 @@ class ComponentsTest(ComponentCommand):  # type: ignore[misc]
                     "type": "list",
                     "name": "profile",
                     "message": "Choose container software to run the test with",
-                    "choices": ["Docker", "Singularity", "Conda"],
+                    "choices": list(CONTAINER_PROFILE_CHOICES),
                 }
                 answer = questionary.unsafe_prompt([question], style=nf_core.utils.nfcore_question_style)
                 profile = answer["profile"].lower()
                 os.environ["PROFILE"] = profile
 
+        # Resolve the profile once, instead of reading $PROFILE again for every nf-test run
+        if not self.profile:
+            self.profile = os.environ["PROFILE"]
+
     def display_nftest_output(self, nftest_out: bytes, nftest_err: bytes) -> None:
         nftest_output = Text.from_ansi(nftest_out.decode())
         print(Panel(nftest_output, title="nf-test output"))
@@ -193,11 +206,10 @@ class ComponentsTest(ComponentCommand):  # type: ignore[misc]
         update = "--update-snapshot" if self.update else ""
         self.update = False  # reset self.update to False to test if the new snapshot is stable
         tag = f"subworkflows/{self.component_name}" if self.component_type == "subworkflows" else self.component_name
-        profile = self.profile if self.profile else os.environ["PROFILE"]
 
         result = nf_core.utils.run_cmd(
             "nf-test",
-            f"test --tag {tag} --profile {profile} {verbose} {update}",
+            f"test --tag {tag} --profile {self.profile} {verbose} {update}",
         )
         if result is not None:
             nftest_out, nftest_err = result
@@ -243,11 +255,10 @@ class ComponentsTest(ComponentCommand):  # type: ignore[misc]
                 if self.no_prompts or Confirm.ask(
                     "nf-test found obsolete snapshots. Do you want to remove them?", default=True
                 ):
-                    profile = self.profile if self.profile else os.environ["PROFILE"]
                     log.info("Removing obsolete snapshots")
                     nf_core.utils.run_cmd(
                         "nf-test",
-                        f"test --tag {self.component_name} --profile {profile} --clean-snapshot",
+                        f"test --tag {self.component_name} --profile {self.profile} --clean-snapshot",
                     )
                 else:
                     log.debug("Obsolete snapshots not removed")
@@ -1,10 +1,13 @@
+import hashlib
 import logging
+import os
 import re
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple, Union
 
 import questionary
 import rich.prompt
+import yaml
 
 import nf_core.utils
 from nf_core.modules.modules_repo import ModulesRepo
@@ -152,3 +155,35 @@ def get_components_to_install(subworkflow_dir: str) -> Tuple[List[str], List[str
                 elif link.startswith("../"):
                     subworkflows.append(name.lower())
     return modules, subworkflows
+
+
+def load_yaml_cached(yaml_path: Union[str, Path]) -> Any:
+    """
+    Load a YAML file (e.g. a module/subworkflow meta.yml), reusing the parsed
+    contents from a previous session if the file has not changed since.
+
+    The parsed contents are pickled to the nf-core cache directory, in one file
+    per path, together with the modification time and size of the YAML file
+    and the nf-core/tools version, so an edited file is always parsed again.
+    Cache files that haven't been written for 30 days are removed.
+
+    Args:
+        yaml_path (str | Path): Path to the YAML file
+
+    Returns:
+        The parsed contents of the file
+    """
+    yaml_path = os.path.abspath(yaml_path)
+    stat = os.stat(yaml_path)
+    # Also invalidate the cache when nf-core/tools is updated, e.g. to a newer YAML loader
+    file_state = (nf_core.__version__, stat.st_mtime_ns, stat.st_size)
+    cache_fn = Path(nf_core.utils.NFCORE_CACHE_DIR, "yaml_cache", f"{hashlib.sha1(yaml_path.encode()).hexdigest()}.pkl")
+    contents = nf_core.utils.load_cached_pickle(cache_fn, file_state)
+    if contents is not None:
+        return contents
+
+    # Let the (C) loader decode the raw bytes itself
+    with open(yaml_path, "rb") as fh:
+        contents = yaml.load(fh, Loader=nf_core.utils.SafeLoader)
+    nf_core.utils.save_cached_pickle(cache_fn, file_state, contents)
+    return contents
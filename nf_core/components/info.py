@@ -3,7 +3,6 @@ import os
 from pathlib import Path
 
 import questionary
-import yaml
 from rich import box
 from rich.console import Group
 from rich.markdown import Markdown
@@ -14,11 +13,31 @@ from rich.text import Text
 
 import nf_core.utils
 from nf_core.components.components_command import ComponentCommand
+from nf_core.components.components_utils import load_yaml_cached
 from nf_core.modules.modules_json import ModulesJson
 from nf_core.modules.modules_repo import NF_CORE_MODULES_REMOTE
 
 log = logging.getLogger(__name__)
 
+# Characters that mark a meta.yml description as containing Markdown
+MARKDOWN_MARKERS = ("[", "*", "`")
+
+
+def _render_description(description):
+    """
+    Only pass a description through the Markdown renderer if it contains Markdown.
+
+    Args:
+        description (str): The description of an input or output channel
+
+    Returns:
+        str or Markdown: The description to put in the table
+    """
+    description = description or ""
+    if any(marker in description for marker in MARKDOWN_MARKERS):
+        return Markdown(description)
+    return description
+
 
 class ComponentInfo(ComponentCommand):
     """
@@ -40,6 +59,8 @@ class ComponentInfo(ComponentCommand):
         contains 'modules.json' file information from a pipeline
     component_name : str
         name of the module/subworkflow to get information from
+    validate : bool
+        whether to check the structure of the meta.yml file before rendering it
 
     Methods
     -------
@@ -47,10 +68,14 @@ class ComponentInfo(ComponentCommand):
         Makes sure that we have a modules/subworkflows name
     get_component_info()
         Given the name of a module/subworkflow, parse meta.yml and print usage help
+    get_component_install_dirs()
+        Map the modules/subworkflows installed from the remote to their install directory
     get_local_yaml()
         Attempt to get the meta.yml file from a locally installed module/subworkflow
     get_remote_yaml()
         Attempt to get the meta.yml file from a remote repo
+    validate_meta()
+        Check that the inputs and outputs in the parsed meta.yml can be rendered
     generate_component_info_help()
         Take the parsed meta.yml and generate rich help
     """
@@ -63,12 +88,15 @@ class ComponentInfo(ComponentCommand):
         remote_url=None,
         branch=None,
         no_pull=False,
+        validate=True,
     ):
         super().__init__(component_type, pipeline_dir, remote_url, branch, no_pull)
+        self.validate = validate
         self.meta = None
         self.local_path = None
         self.remote_location = None
         self.local = None
+        self._component_to_dir = {}
 
         if self.repo_type == "pipeline":
             # Check modules directory structure
@@ -117,12 +145,13 @@ class ComponentInfo(ComponentCommand):
             else:
                 components = self.modules_repo.get_avail_components(self.component_type)
             components.sort()
+            valid_components = frozenset(components)
             component = questionary.autocomplete(
                 f"Please select a {self.component_type[:-1]}",
                 choices=components,
                 style=nf_core.utils.nfcore_question_style,
             ).unsafe_ask()
-            while component not in components:
+            while component not in valid_components:
                 log.info(f"'{component}' is not a valid {self.component_type[:-1]} name")
                 component = questionary.autocomplete(
                     f"Please select a new {self.component_type[:-1]}",
@@ -132,19 +161,32 @@ class ComponentInfo(ComponentCommand):
         else:
             if self.repo_type == "pipeline":
                 # check if the module is locally installed
-                local_paths = self.modules_json.get_all_components(self.component_type).get(
-                    self.modules_repo.remote_url, {}
-                )
-                for directory, comp in local_paths:
-                    if comp == component:
-                        component_base_path = Path(self.dir, self.component_type)
-                        self.local_path = Path(component_base_path, directory, component)
-                        break
-                if self.local_path:
+                install_dir = (self.get_component_install_dirs() or {}).get(component)
+                if install_dir is not None:
+                    self.local_path = Path(self.dir, self.component_type, install_dir, component)
                     self.local = True
 
         return component
 
+    def get_component_install_dirs(self):
+        """
+        Map the modules/subworkflows installed from the remote to their install directory.
+
+        The mapping is built once per remote from the modules.json file.
+
+        Returns:
+            dict or None: The install directory of each module/subworkflow,
+                None if nothing is installed from the remote
+        """
+        remote_url = self.modules_repo.remote_url
+        if remote_url not in self._component_to_dir:
+            components = self.modules_json.get_all_components(self.component_type).get(remote_url)
+            # Iterate in reverse so that the first install directory wins for duplicated names
+            self._component_to_dir[remote_url] = (
+                None if components is None else {component: directory for directory, component in reversed(components)}
+            )
+        return self._component_to_dir[remote_url]
+
     def get_component_info(self):
         """Given the name of a module/subworkflow, parse meta.yml and print usage help."""
 
@@ -160,6 +202,9 @@ class ComponentInfo(ComponentCommand):
         if self.meta is False:
             raise UserWarning(f"Could not find {self.component_type[:-1]} '{self.component}'")
 
+        if self.validate:
+            self.validate_meta()
+
         return self.generate_component_info_help()
 
     def get_local_yaml(self):
@@ -171,34 +216,36 @@ class ComponentInfo(ComponentCommand):
 
         if self.repo_type == "pipeline":
             # Try to find and load the meta.yml file
-            component_base_path = Path(self.dir, self.component_type)
             # Check that we have any modules/subworkflows installed from this repo
-            components = self.modules_json.get_all_components(self.component_type).get(self.modules_repo.remote_url)
-            component_names = [component for _, component in components]
-            if components is None:
+            component_to_dir = self.get_component_install_dirs()
+            if component_to_dir is None:
                 raise LookupError(f"No {self.component_type[:-1]} installed from {self.modules_repo.remote_url}")
 
-            if self.component in component_names:
-                install_dir = [dir for dir, module in components if module == self.component][0]
-                comp_dir = Path(component_base_path, install_dir, self.component)
+            install_dir = component_to_dir.get(self.component)
+            if install_dir is not None:
+                comp_dir = Path(self.dir, self.component_type, install_dir, self.component)
                 meta_fn = Path(comp_dir, "meta.yml")
-                if meta_fn.exists():
+                try:
+                    meta = load_yaml_cached(meta_fn)
+                except (FileNotFoundError, NotADirectoryError):
+                    pass
+                else:
                     log.debug(f"Found local file: {meta_fn}")
-                    with open(meta_fn) as fh:
-                        self.local_path = comp_dir
-                        return yaml.safe_load(fh)
+                    self.local_path = comp_dir
+                    return meta
 
             log.debug(f"{self.component_type[:-1].title()} '{self.component}' meta.yml not found locally")
         else:
-            component_base_path = Path(self.dir, self.component_type, self.org)
-            if self.component in os.listdir(component_base_path):
-                comp_dir = Path(component_base_path, self.component)
-                meta_fn = Path(comp_dir, "meta.yml")
-                if meta_fn.exists():
-                    log.debug(f"Found local file: {meta_fn}")
-                    with open(meta_fn) as fh:
-                        self.local_path = comp_dir
-                        return yaml.safe_load(fh)
+            comp_dir = Path(self.dir, self.component_type, self.org, self.component)
+            meta_fn = Path(comp_dir, "meta.yml")
+            try:
+                meta = load_yaml_cached(meta_fn)
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+            else:
+                log.debug(f"Found local file: {meta_fn}")
+                self.local_path = comp_dir
+                return meta
             log.debug(f"{self.component_type[:-1].title()} '{self.component}' meta.yml not found locally")
 
         return None
@@ -210,14 +257,34 @@ class ComponentInfo(ComponentCommand):
             dict or bool: Parsed meta.yml found, False otherwise
         """
         # Check if our requested module/subworkflow is there
-        if self.component not in self.modules_repo.get_avail_components(self.component_type):
+        if not self.modules_repo.has_component(self.component, self.component_type):
             return False
 
-        file_contents = self.modules_repo.get_meta_yml(self.component_type, self.component)
-        if file_contents is None:
+        meta_fn = Path(self.modules_repo.get_component_dir(self.component, self.component_type), "meta.yml")
+        if not meta_fn.exists():
             return False
         self.remote_location = self.modules_repo.remote_url
-        return yaml.safe_load(file_contents)
+        return load_yaml_cached(meta_fn)
+
+    def validate_meta(self):
+        """Check that the inputs and outputs in the parsed meta.yml can be rendered.
+
+        Raises:
+            UserWarning: If the meta.yml is not structured as expected
+        """
+        if not isinstance(self.meta, dict):
+            raise UserWarning(f"The meta.yml of {self.component_type[:-1]} '{self.component}' is not a mapping")
+        for channel_type in ["input", "output"]:
+            for channel in self.meta.get(channel_type) or []:
+                if not isinstance(channel, dict) or not all(isinstance(info, dict) for info in channel.values()):
+                    raise UserWarning(
+                        f"Malformed '{channel_type}' entry in the meta.yml of {self.component_type[:-1]} '{self.component}': {channel}"
+                    )
+                for key, info in channel.items():
+                    if "type" not in info:
+                        raise UserWarning(
+                            f"Missing 'type' for {channel_type} '{key}' in the meta.yml of {self.component_type[:-1]} '{self.component}'"
+                        )
 
     def generate_component_info_help(self):
         """Take the parsed meta.yml and generate rich help.
@@ -270,13 +337,17 @@ class ComponentInfo(ComponentCommand):
             inputs_table.add_column(":inbox_tray: Inputs")
             inputs_table.add_column("Description")
             inputs_table.add_column("Pattern", justify="right", style="green")
-            for input in self.meta["input"]:
-                for key, info in input.items():
-                    inputs_table.add_row(
-                        f"[orange1 on black] {key} [/][dim i] ({info['type']})",
-                        Markdown(info["description"] if info["description"] else ""),
-                        info.get("pattern", ""),
-                    )
+            rows = [
+                (
+                    f"[orange1 on black] {key} [/][dim i] ({info.get('type', '')})",
+                    _render_description(info.get("description")),
+                    info.get("pattern", ""),
+                )
+                for input in self.meta["input"]
+                for key, info in input.items()
+            ]
+            for row in rows:
+                inputs_table.add_row(*row)
 
             renderables.append(inputs_table)
 
@@ -286,13 +357,17 @@ class ComponentInfo(ComponentCommand):
             outputs_table.add_column(":outbox_tray: Outputs")
             outputs_table.add_column("Description")
             outputs_table.add_column("Pattern", justify="right", style="green")
-            for output in self.meta["output"]:
-                for key, info in output.items():
-                    outputs_table.add_row(
-                        f"[orange1 on black] {key} [/][dim i] ({info['type']})",
-                        Markdown(info["description"] if info["description"] else ""),
-                        info.get("pattern", ""),
-                    )
+            rows = [
+                (
+                    f"[orange1 on black] {key} [/][dim i] ({info.get('type', '')})",
+                    _render_description(info.get("description")),
+                    info.get("pattern", ""),
+                )
+                for output in self.meta["output"]
+                for key, info in output.items()
+            ]
+            for row in rows:
+                outputs_table.add_row(*row)
 
             renderables.append(outputs_table)
 
@@ -75,6 +75,8 @@ class ComponentLint(ComponentCommand):
         self.passed = []
         self.warned = []
         self.failed = []
+        # Parsed meta.yml files of the components being linted, keyed by path
+        self.meta_yamls = {}
         if self.component_type == "modules":
             self.lint_tests = self.get_all_module_lint_tests(self.repo_type == "pipeline")
         else:
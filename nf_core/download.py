@@ -167,6 +167,7 @@ class DownloadWorkflow:
         self.nf_config = {}
         self.containers = []
         self.containers_remote = []  # stores the remote images provided in the file.
+        self.singularity_executable = None  # 'singularity' or 'apptainer', looked up when first needed
 
         # Fetch remote workflows
         self.wfs = nf_core.list.Workflows()
@@ -1121,7 +1122,7 @@ class DownloadWorkflow:
 
                 # Exit if we need to pull images and Singularity is not installed
                 if len(containers_pull) > 0:
-                    if not (shutil.which("singularity") or shutil.which("apptainer")):
+                    if self.get_singularity_executable() is None:
                         raise OSError(
                             "Singularity/Apptainer is needed to pull images, but it is not installed or not in $PATH"
                         )
@@ -1365,6 +1366,21 @@ class DownloadWorkflow:
         finally:
             del output_path_tmp
 
+    def get_singularity_executable(self) -> Optional[str]:
+        """Find the executable to pull Singularity images with.
+
+        $PATH is only searched until an executable is found, which is then reused for all images.
+
+        Returns:
+            str or None: 'singularity' or 'apptainer', None if neither is installed
+        """
+        if self.singularity_executable is None:
+            if shutil.which("singularity"):
+                self.singularity_executable = "singularity"
+            elif shutil.which("apptainer"):
+                self.singularity_executable = "apptainer"
+        return self.singularity_executable
+
     def singularity_pull_image(
         self, container: str, out_path: str, cache_path: Optional[str], library: List[str], progress: DownloadProgress
     ) -> None:
@@ -1398,18 +1414,10 @@ class DownloadWorkflow:
             address = f"docker://{library}/{container.replace('docker://', '')}"
             absolute_URI = False
 
-        if shutil.which("singularity"):
-            singularity_command = [
-                "singularity",
-                "pull",
-                "--name",
-                output_path,
-                address,
-            ]
-        elif shutil.which("apptainer"):
-            singularity_command = ["apptainer", "pull", "--name", output_path, address]
-        else:
+        singularity_executable = self.get_singularity_executable()
+        if singularity_executable is None:
             raise OSError("Singularity/Apptainer is needed to pull images, but it is not installed or not in $PATH")
+        singularity_command = [singularity_executable, "pull", "--name", output_path, address]
         log.debug(f"Building singularity image: {address}")
         log.debug(f"Singularity command: {' '.join(singularity_command)}")
 
@@ -173,6 +173,9 @@ class ModuleLint(ComponentLint):
             console=console,
             disable=self.hide_progress or os.environ.get("HIDE_PROGRESS", None) is not None,
         )
+        if not local:
+            # Read the meta.yml files of all modules up front
+            self.meta_yamls.update(self._load_yamls([mod.meta_yml for mod in modules]))
         with progress_bar:
             lint_progress = progress_bar.add_task(
                 f"Linting {'local' if local else 'nf-core'} modules",
@@ -55,8 +55,10 @@ def meta_yml(module_lint_object: ComponentLint, module: NFCoreComponent) -> None
             meta_yaml = yaml.safe_load("".join(lines))
     if meta_yaml is None:
         try:
-            with open(module.meta_yml) as fh:
-                meta_yaml = yaml.safe_load(fh)
+            meta_yaml = module_lint_object.meta_yamls.get(str(module.meta_yml))
+            if meta_yaml is None:
+                with open(module.meta_yml) as fh:
+                    meta_yaml = yaml.safe_load(fh)
             module.passed.append(("meta_yml_exists", "Module `meta.yml` exists", module.meta_yml))
         except FileNotFoundError:
             module.failed.append(("meta_yml_exists", "Module `meta.yml` does not exist", module.meta_yml))
@@ -1,11 +1,13 @@
 import copy
 import datetime
+import hashlib
 import json
 import logging
 import os
 import shutil
 import tempfile
 from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
 
 import git
 import questionary
@@ -26,11 +28,35 @@ from .modules_differ import ModulesDiffer
 log = logging.getLogger(__name__)
 
 
+def _dir_mtime(path: Union[str, Path]) -> Optional[int]:
+    """Get the modification time of a directory, or None if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _file_state(path: Union[str, Path]) -> Optional[Tuple[int, int]]:
+    """Get the modification time and size of a file, or None if it does not exist"""
+    try:
+        file_stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
 class ModulesJson:
     """
     An object for handling a 'modules.json' file in a pipeline
     """
 
+    # The state of each pipeline directory after its last successful check_up_to_date():
+    # the modification time and size of 'modules.json' and of every subworkflow 'main.nf',
+    # and the modification time of every component directory
+    up_to_date_cache: Dict[
+        str, Tuple[Tuple[Tuple[str, Optional[Tuple[int, int]]], ...], Tuple[Tuple[str, Optional[int]], ...]]
+    ] = {}
+
     def __init__(self, pipeline_dir: str):
         """
         Initialise the object.
@@ -408,26 +434,37 @@ class ModulesJson:
         # Add all modules from modules.json to missing_installation
         missing_installation = copy.deepcopy(self.modules_json["repos"])
         # Obtain the path of all installed modules
-        module_dirs = [
-            Path(dir_name).relative_to(self.modules_dir)
-            for dir_name, _, file_names in os.walk(self.modules_dir)
-            if "main.nf" in file_names and not str(Path(dir_name).relative_to(self.modules_dir)).startswith("local")
-        ]
+        module_dirs = self._installed_component_dirs(self.modules_dir)
         untracked_dirs_modules, missing_installation = self.parse_dirs(module_dirs, missing_installation, "modules")
 
         # Obtain the path of all installed subworkflows
-        subworkflow_dirs = [
-            Path(dir_name).relative_to(self.subworkflows_dir)
-            for dir_name, _, file_names in os.walk(self.subworkflows_dir)
-            if "main.nf" in file_names
-            and not str(Path(dir_name).relative_to(self.subworkflows_dir)).startswith("local")
-        ]
+        subworkflow_dirs = self._installed_component_dirs(self.subworkflows_dir)
         untracked_dirs_subworkflows, missing_installation = self.parse_dirs(
             subworkflow_dirs, missing_installation, "subworkflows"
         )
 
         return untracked_dirs_modules, untracked_dirs_subworkflows, missing_installation
 
+    def _installed_component_dirs(self, components_dir):
+        """
+        Find the directories containing a 'main.nf' file, excluding the local ones
+
+        Args:
+            components_dir (Path): The 'modules' or 'subworkflows' directory of the pipeline
+
+        Returns:
+            [ Path ]: The directories, relative to `components_dir`
+        """
+        components_dir = os.fspath(components_dir)
+        # os.walk joins the names onto `components_dir`, so the relative path is everything after this prefix
+        prefix_len = len(os.path.join(components_dir, ""))
+        component_dirs = []
+        for dir_name, _, file_names in os.walk(components_dir):
+            rel_dir = dir_name[prefix_len:]
+            if "main.nf" in file_names and not rel_dir.startswith("local"):
+                component_dirs.append(Path(rel_dir))
+        return component_dirs
+
     def parse_dirs(self, dirs, missing_installation, component_type):
         untracked_dirs = []
         for dir_ in dirs:
@@ -552,6 +589,12 @@ class ModulesJson:
         Check that we have the "installed_by" value in 'modules.json', otherwise add it.
         Assume that the modules/subworkflows were installed by an nf-core command (don't track installed by subworkflows).
         """
+        cache_key = os.path.abspath(self.dir)
+        if self.unchanged_since_check(cache_key):
+            log.debug("'modules.json' and the installed components have not changed since they were last checked")
+            self.load()
+            return
+
         dump_modules_json = False
         try:
             self.load()
@@ -626,6 +669,95 @@ class ModulesJson:
         if dump_modules_json:
             self.dump(run_prettier=True)
 
+        ModulesJson.up_to_date_cache[cache_key] = self.get_pipeline_state()
+        self.save_pipeline_state(cache_key)
+
+    def get_pipeline_state(self):
+        """
+        Get the modification time and size of the 'modules.json' file and of every subworkflow
+        'main.nf' file, and the modification time of every directory under 'modules/' and 'subworkflows/'.
+
+        Installing or removing a module/subworkflow always modifies one of these directories.
+        The 'main.nf' files of the subworkflows are recorded because the components they include
+        are read from them, and editing a file in place doesn't modify its directory.
+
+        Returns:
+            (((str, (int, int) | None), ...), ((str, int | None), ...)): The state of the pipeline
+        """
+        file_states = [(str(self.modules_json_path), _file_state(self.modules_json_path))]
+        dir_mtimes = []
+        for components_dir in [self.modules_dir, self.subworkflows_dir]:
+            # Also record a missing directory, so that creating it changes the state
+            dir_mtimes.append((str(components_dir), _dir_mtime(components_dir)))
+            for dir_name, subdir_names, file_names in os.walk(components_dir):
+                for subdir_name in subdir_names:
+                    subdir = os.path.join(dir_name, subdir_name)
+                    dir_mtimes.append((subdir, _dir_mtime(subdir)))
+                if components_dir == self.subworkflows_dir and "main.nf" in file_names:
+                    main_nf = os.path.join(dir_name, "main.nf")
+                    file_states.append((main_nf, _file_state(main_nf)))
+        return tuple(file_states), tuple(dir_mtimes)
+
+    def unchanged_since_check(self, cache_key):
+        """
+        Check whether the pipeline is still in the state recorded after its last check_up_to_date().
+
+        Only the recorded paths are stat'ed, since adding or removing a
+        directory modifies its (recorded) parent directory.
+
+        Args:
+            cache_key (str): The absolute path of the pipeline directory
+
+        Returns:
+            (bool): True if nothing has changed since the last check
+        """
+        if cache_key not in ModulesJson.up_to_date_cache:
+            # Fall back to the state saved by a previous session
+            saved_state = self.load_pipeline_state(cache_key)
+            if saved_state is None:
+                return False
+            ModulesJson.up_to_date_cache[cache_key] = saved_state
+        file_states, dir_mtimes = ModulesJson.up_to_date_cache[cache_key]
+        if not all(_file_state(file_path) == state for file_path, state in file_states):
+            return False
+        return all(_dir_mtime(directory) == mtime for directory, mtime in dir_mtimes)
+
+    @staticmethod
+    def pipeline_state_path(cache_key):
+        """
+        Get the path of the file in the nf-core cache directory where the state of a pipeline is saved.
+
+        Args:
+            cache_key (str): The absolute path of the pipeline directory
+        """
+        path_hash = hashlib.sha1(cache_key.encode()).hexdigest()
+        return Path(nf_core.utils.NFCORE_CACHE_DIR, "modules_json_state", f"{path_hash}.pkl")
+
+    def load_pipeline_state(self, cache_key):
+        """
+        Load the state of a pipeline saved after its last successful check_up_to_date() in a previous session.
+
+        Args:
+            cache_key (str): The absolute path of the pipeline directory
+
+        Returns:
+            The saved state, or None if there is none
+        """
+        # What check_up_to_date() checks and fixes can change between versions of nf-core/tools
+        return nf_core.utils.load_cached_pickle(self.pipeline_state_path(cache_key), nf_core.__version__)
+
+    def save_pipeline_state(self, cache_key):
+        """
+        Save the state of a pipeline after a successful check_up_to_date(), so that
+        the check can be skipped by later sessions while nothing has changed.
+
+        Args:
+            cache_key (str): The absolute path of the pipeline directory
+        """
+        nf_core.utils.save_cached_pickle(
+            self.pipeline_state_path(cache_key), nf_core.__version__, ModulesJson.up_to_date_cache[cache_key]
+        )
+
     def load(self):
         """
         Loads the modules.json file into the variable 'modules_json'
@@ -1,6 +1,7 @@
 import logging
 import os
 import shutil
+import time
 
 import git
 import rich
@@ -18,6 +19,8 @@ log = logging.getLogger(__name__)
 NF_CORE_MODULES_NAME = "nf-core"
 NF_CORE_MODULES_REMOTE = "https://github.com/nf-core/modules.git"
 NF_CORE_MODULES_DEFAULT_BRANCH = "master"
+# Don't fetch a local clone again if it was fetched less than this many seconds ago
+NF_CORE_MODULES_FETCH_TTL = 300
 
 
 class ModulesRepo(SyncedRepo):
@@ -111,7 +114,8 @@ class ModulesRepo(SyncedRepo):
             else:
                 self.repo = git.Repo(self.local_repo_dir)
 
-                if ModulesRepo.no_pull_global:
+                # A branch given explicitly may have been pushed after the last fetch, so always fetch then
+                if ModulesRepo.no_pull_global or (branch is None and self.recently_fetched()):
                     ModulesRepo.update_local_repo_status(self.fullname, True)
                 # If the repo is already cloned, fetch the latest changes from the remote
                 if not ModulesRepo.local_repo_synced(self.fullname):
@@ -122,9 +126,14 @@ class ModulesRepo(SyncedRepo):
                         transient=True,
                         disable=hide_progress or os.environ.get("HIDE_PROGRESS", None) is not None,
                     )
-                    with pbar:
-                        self.repo.remotes.origin.fetch(
-                            progress=RemoteProgressbar(pbar, self.fullname, self.remote_url, "Pulling")
+                    try:
+                        with pbar:
+                            self.repo.remotes.origin.fetch(
+                                progress=RemoteProgressbar(pbar, self.fullname, self.remote_url, "Pulling")
+                            )
+                    except GitCommandError as e:
+                        log.warning(
+                            f"Could not fetch the latest changes from '{self.remote_url}', using the local copy instead:\n{e}"
                         )
                     ModulesRepo.update_local_repo_status(self.fullname, True)
 
@@ -145,3 +154,17 @@ class ModulesRepo(SyncedRepo):
                 self.setup_local_repo(remote, branch, hide_progress)
             else:
                 raise LookupError("Exiting due to error with local modules git repo")
+
+    def recently_fetched(self):
+        """
+        Checks whether the local clone was fetched from the remote less than
+        NF_CORE_MODULES_FETCH_TTL seconds ago
+
+        Returns:
+            (bool): Whether the last fetch is recent enough to skip fetching again
+        """
+        try:
+            last_fetch = os.path.getmtime(os.path.join(self.local_repo_dir, ".git", "FETCH_HEAD"))
+        except OSError:
+            return False
+        return time.time() - last_fetch < NF_CORE_MODULES_FETCH_TTL
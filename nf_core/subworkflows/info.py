@@ -13,5 +13,6 @@ class SubworkflowInfo(ComponentInfo):
         remote_url=None,
         branch=None,
         no_pull=False,
+        validate=True,
     ):
-        super().__init__("subworkflows", pipeline_dir, component_name, remote_url, branch, no_pull)
+        super().__init__("subworkflows", pipeline_dir, component_name, remote_url, branch, no_pull, validate)
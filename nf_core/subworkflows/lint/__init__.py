@@ -167,6 +167,9 @@ class SubworkflowLint(ComponentLint):
             console=console,
             disable=self.hide_progress or os.environ.get("HIDE_PROGRESS", None) is not None,
         )
+        if not local:
+            # Read the meta.yml files of all subworkflows up front
+            self.meta_yamls.update(self._load_yamls([swf.meta_yml for swf in subworkflows]))
         with progress_bar:
             lint_progress = progress_bar.add_task(
                 f"Linting {'local' if local else 'nf-core'} subworkflows",
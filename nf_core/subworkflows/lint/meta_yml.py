@@ -26,8 +26,10 @@ def meta_yml(subworkflow_lint_object, subworkflow):
     """
     # Read the meta.yml file
     try:
-        with open(subworkflow.meta_yml) as fh:
-            meta_yaml = yaml.safe_load(fh)
+        meta_yaml = subworkflow_lint_object.meta_yamls.get(str(subworkflow.meta_yml))
+        if meta_yaml is None:
+            with open(subworkflow.meta_yml) as fh:
+                meta_yaml = yaml.safe_load(fh)
         subworkflow.passed.append(("meta_yml_exists", "Subworkflow `meta.yml` exists", subworkflow.meta_yml))
     except FileNotFoundError:
         subworkflow.failed.append(("meta_yml_exists", "Subworkflow `meta.yml` does not exist", subworkflow.meta_yml))
@@ -1,13 +1,14 @@
 import filecmp
 import logging
 import os
-import shutil
+import posixpath
+import stat
 from configparser import NoOptionError, NoSectionError
 from pathlib import Path
-from typing import Dict
+from typing import Dict, FrozenSet, Tuple
 
 import git
-from git.exc import GitCommandError
+from git.exc import BadName, GitCommandError
 
 from nf_core.utils import load_tools_config
 
@@ -19,6 +20,85 @@ NF_CORE_MODULES_REMOTE = "https://github.com/nf-core/modules.git"
 NF_CORE_MODULES_DEFAULT_BRANCH = "master"
 
 
+# The maximum number of symbolic links followed to resolve a single link, like the ELOOP limit of the OS
+MAX_SYMLINK_HOPS = 40
+
+
+def _resolve_symlink(root_tree, link):
+    """
+    Find the file or directory a symbolic link in a git tree points to.
+
+    Args:
+        root_tree (git.Tree): The root tree of the commit
+        link (git.Blob): The symbolic link
+
+    Returns:
+        (git.Blob | git.Tree): The git object the link points to
+
+    Raises:
+        LookupError: If the link points outside the repository, to a missing path or to too many other links
+    """
+    for _ in range(MAX_SYMLINK_HOPS):
+        link_target = link.data_stream.read().decode()
+        target_path = posixpath.normpath(posixpath.join(posixpath.dirname(link.path), link_target))
+        if posixpath.isabs(link_target) or target_path == ".." or target_path.startswith("../"):
+            raise LookupError(f"The symbolic link '{link.path}' points outside the repository: '{link_target}'")
+        try:
+            target = root_tree / target_path
+        except KeyError:
+            raise LookupError(f"The symbolic link '{link.path}' points to a missing path: '{link_target}'")
+        if target.type != "blob" or target.mode != target.link_mode:
+            return target
+        link = target
+    raise LookupError(f"Too many levels of symbolic links to resolve '{link.path}'")
+
+
+def _write_blob(blob, file_path):
+    """
+    Write the contents of a git blob to a file.
+
+    The file is created with the permissions git would check it out with, so the umask is respected.
+
+    Args:
+        blob (git.Blob): The file in the git tree
+        file_path (Path): The path of the file to write
+    """
+    mode = 0o777 if blob.mode & stat.S_IXUSR else 0o666
+    with os.fdopen(os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode), "wb") as fh:
+        blob.stream_data(fh)
+
+
+def _write_tree(root_tree, tree, install_dir, parent_trees=()):
+    """
+    Write the files of a git tree to a directory.
+
+    Symbolic links are replaced by a copy of the file or directory they point to,
+    like copying a checked out tree with shutil.copytree does.
+
+    Args:
+        root_tree (git.Tree): The root tree of the commit, to resolve symbolic links in
+        tree (git.Tree): The tree to write
+        install_dir (Path): The directory to write the files to
+        parent_trees (( bytes )): The SHAs of the trees that are being written, to detect loops
+
+    Raises:
+        LookupError: If a symbolic link can't be resolved, or points to a directory it is in
+    """
+    os.makedirs(install_dir, exist_ok=True)
+    parent_trees = (*parent_trees, tree.binsha)
+    for item in tree:
+        item_path = Path(install_dir, item.name)
+        if item.type == "blob" and item.mode == item.link_mode:
+            link_path = item.path
+            item = _resolve_symlink(root_tree, item)
+            if item.type == "tree" and item.binsha in parent_trees:
+                raise LookupError(f"The symbolic link '{link_path}' points to a directory it is in")
+        if item.type == "tree":
+            _write_tree(root_tree, item, item_path, parent_trees)
+        elif item.type == "blob":
+            _write_blob(item, item_path)
+
+
 class RemoteProgressbar(git.RemoteProgress):
     """
     An object to create a progressbar for when doing an operation with the remote.
@@ -63,6 +143,8 @@ class SyncedRepo:
 
     local_repo_statuses: Dict[str, bool] = {}
     no_pull_global = False
+    # Available modules/subworkflows per (repo name, component type, commit SHA)
+    avail_components_cache: Dict[Tuple[str, str, str], Tuple[Tuple[str, ...], FrozenSet[str]]] = {}
 
     @staticmethod
     def local_repo_synced(repo_name):
@@ -183,8 +265,12 @@ class SyncedRepo:
         """
         Gets the default branch for the repo (the branch origin/HEAD is pointing to)
         """
-        origin_head = next(ref for ref in self.repo.refs if ref.name == "origin/HEAD")
-        _, branch = origin_head.ref.name.split("/")
+        # Read the symbolic ref directly instead of listing all the refs of the repo
+        origin_head = git.SymbolicReference(self.repo, "refs/remotes/origin/HEAD")
+        try:
+            _, branch = origin_head.ref.name.split("/")
+        except (ValueError, TypeError):
+            raise LookupError(f"Could not find the default branch of '{self.remote_url}'")
         return branch
 
     def branch_exists(self):
@@ -256,7 +342,37 @@ class SyncedRepo:
         Returns:
             (bool): Whether the module/subworkflow exists in this branch of the repository
         """
-        return component_name in self.get_avail_components(component_type, checkout=checkout, commit=commit)
+        return self.has_component(component_name, component_type, checkout=checkout, commit=commit)
+
+    def has_component(self, component_name, component_type, checkout=True, commit=None):
+        """
+        Check if a module/subworkflow is available in the repo at the checked out commit,
+        or at the given commit.
+
+        Uses the cached set of component names for the commit, so
+        repeated checks don't list the repository again.
+
+        Args:
+            component_name (str): The name of the module/subworkflow
+            component_type (str): Either 'modules' or 'subworkflows'
+            checkout (bool): Whether to check out the branch before the lookup
+            commit (str): The git SHA of the commit to look in. It is read from the
+                          git tree, so the local copy is not checked out.
+
+        Returns:
+            (bool): Whether the module/subworkflow is available
+        """
+        if commit is not None:
+            try:
+                commit_sha = self.repo.commit(commit).hexsha
+            except (BadName, ValueError):
+                return False
+            _, avail_components = self._list_avail_components(component_type, commit_sha)
+            return component_name in avail_components
+        if checkout:
+            self.checkout_branch()
+        _, avail_components = self._list_avail_components(component_type)
+        return component_name in avail_components
 
     def get_component_dir(self, component_name, component_type):
         """
@@ -285,24 +401,27 @@ class SyncedRepo:
         Returns:
             (bool): Whether the operation was successful or not
         """
-        # Check out the repository at the requested ref
+        # Look up the requested ref without checking it out
         try:
-            self.checkout(commit)
-        except git.GitCommandError:
+            commit_obj = self.repo.commit(commit)
+        except (BadName, ValueError):
             return False
 
         # Check if the module/subworkflow exists in the branch
-        if not self.component_exists(component_name, component_type, checkout=False):
+        _, avail_components = self._list_avail_components(component_type, commit_obj.hexsha)
+        if component_name not in avail_components:
             log.error(
                 f"The requested {component_type[:-1]} does not exists in the branch '{self.branch}' of {self.remote_url}'"
             )
             return False
 
-        # Copy the files from the repo to the install folder
-        shutil.copytree(self.get_component_dir(component_name, component_type), Path(install_dir, component_name))
-
-        # Switch back to the tip of the branch
-        self.checkout_branch()
+        # Write the files from the git objects of the commit to the install folder
+        component_tree = commit_obj.tree / f"{component_type}/{self.repo_path}/{component_name}"
+        try:
+            _write_tree(commit_obj.tree, component_tree, Path(install_dir, component_name))
+        except LookupError as e:
+            log.error(f"Could not install {component_type[:-1]} '{component_name}': {e}")
+            return False
         return True
 
     def component_files_identical(self, component_name, base_path, commit, component_type):
@@ -420,38 +539,40 @@ class SyncedRepo:
             self.checkout_branch()
         if commit is not None:
             self.checkout(commit)
-        # Get directory
-        if component_type == "modules":
-            directory = self.modules_dir
-        elif component_type == "subworkflows":
-            directory = self.subworkflows_dir
-        # Module/Subworkflow directories are characterized by having a 'main.nf' file
-        avail_component_names = [
-            os.path.relpath(dirpath, start=directory)
-            for dirpath, _, file_names in os.walk(directory)
-            if "main.nf" in file_names
-        ]
-        return avail_component_names
+        avail_component_names, _ = self._list_avail_components(component_type)
+        return list(avail_component_names)
 
-    def get_meta_yml(self, component_type, module_name):
+    def _list_avail_components(self, component_type, commit_sha=None):
         """
-        Returns the contents of the 'meta.yml' file of a module
+        Lists the modules/subworkflows in a commit of the repository.
+
+        The result only depends on the commit, so it is cached for the rest of the session.
 
         Args:
-            module_name (str): The name of the module
+            component_type (str): Either 'modules' or 'subworkflows'
+            commit_sha (str): The full git SHA of the commit. Defaults to the checked out commit.
 
         Returns:
-            (str): The contents of the file in text format
+            (( str ), frozenset[ str ]): The module/subworkflow names, as a tuple and as a set
         """
-        self.checkout_branch()
-        if component_type == "modules":
-            path = Path(self.modules_dir, module_name, "meta.yml")
-        elif component_type == "subworkflows":
-            path = Path(self.subworkflows_dir, module_name, "meta.yml")
-        else:
+        if component_type not in ("modules", "subworkflows"):
             raise ValueError(f"Invalid component type: {component_type}")
-        if not path.exists():
-            return None
-        with open(path) as fh:
-            contents = fh.read()
-        return contents
+        if commit_sha is None:
+            commit_sha = self.repo.head.commit.hexsha
+        cache_key = (self.fullname, component_type, commit_sha)
+        if cache_key not in SyncedRepo.avail_components_cache:
+            directory = f"{component_type}/{self.repo_path}"
+            # Module/Subworkflow directories are characterized by having a 'main.nf' file.
+            # List the files from the git tree of the commit instead of walking the working tree.
+            # -z gives the raw paths instead of C-quoting those with special characters
+            tree_files = self.repo.git.ls_tree("-r", "-z", "--name-only", commit_sha, "--", directory).split("\0")
+            # All paths start with the directory, so the name can be sliced out between it and '/main.nf'
+            prefix_len = len(directory) + 1
+            suffix_len = len("/main.nf")
+            avail_component_names = tuple(
+                file_path[prefix_len:-suffix_len]
+                for file_path in tree_files
+                if file_path.endswith("/main.nf") and len(file_path) > prefix_len + suffix_len
+            )
+            SyncedRepo.avail_components_cache[cache_key] = (avail_component_names, frozenset(avail_component_names))
+        return SyncedRepo.avail_components_cache[cache_key]
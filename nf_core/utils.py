@@ -11,15 +11,17 @@ import json
 import logging
 import mimetypes
 import os
+import pickle
 import random
 import re
 import shlex
 import subprocess
 import sys
+import tempfile
 import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, Tuple, Union
+from typing import Any, Generator, Set, Tuple, Union
 
 import git
 import prompt_toolkit
@@ -36,6 +38,18 @@ import nf_core
 
 log = logging.getLogger(__name__)
 
+# Use the libyaml C bindings to parse YAML when PyYAML has been built with them
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+# Use orjson to decode GitHub API responses when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
 # Custom style for questionary
 nfcore_question_style = prompt_toolkit.styles.Style(
     [
@@ -382,6 +396,83 @@ def setup_nfcore_cachedir(cache_fn: Union[str, Path]) -> Path:
     return cachedir
 
 
+# Cache files written by save_cached_pickle() that haven't been written for this long are removed
+CACHED_PICKLE_MAX_AGE = datetime.timedelta(days=30)
+# The cache directories that have already been pruned in this session
+_pruned_cache_dirs: Set[Path] = set()
+
+
+def prune_cache_dir(cache_dir: Union[str, Path]) -> None:
+    """
+    Remove the files in a cache directory that haven't been written for CACHED_PICKLE_MAX_AGE,
+    e.g. those of files and pipelines that have been deleted since.
+
+    Each directory is only pruned once per session.
+
+    Args:
+        cache_dir (str | Path): The cache directory to prune
+    """
+    cache_dir = Path(cache_dir)
+    if cache_dir in _pruned_cache_dirs:
+        return
+    _pruned_cache_dirs.add(cache_dir)
+    oldest_mtime = (datetime.datetime.now() - CACHED_PICKLE_MAX_AGE).timestamp()
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < oldest_mtime:
+                    log.debug(f"Removing old cache file '{entry.path}'")
+                    os.unlink(entry.path)
+    except OSError as e:
+        log.debug(f"Could not prune the cache directory '{cache_dir}': {e}")
+
+
+def load_cached_pickle(cache_fn: Union[str, Path], state: Any) -> Any:
+    """
+    Load an object saved to the cache directory with save_cached_pickle().
+
+    Args:
+        cache_fn (str | Path): The path of the cache file
+        state: The state the object must have been saved with, e.g. the modification time of its source file
+
+    Returns:
+        The cached object, or None if there is no readable cache file for this state
+    """
+    try:
+        with open(cache_fn, "rb") as fh:
+            cached_state, obj = pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError) as e:
+        log.debug(f"Could not read cache file '{cache_fn}': {e}")
+        return None
+    return obj if cached_state == state else None
+
+
+def save_cached_pickle(cache_fn: Union[str, Path], state: Any, obj: Any) -> None:
+    """
+    Pickle an object to a file in the cache directory, together with the state it is valid for.
+
+    Failing to write the file is not an error, the object is simply not cached.
+    Old files in the same directory are removed with prune_cache_dir().
+
+    Args:
+        cache_fn (str | Path): The path of the cache file
+        state: The state the object is valid for, compared by load_cached_pickle()
+        obj: The object to cache
+    """
+    cache_dir = Path(cache_fn).parent
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that concurrent readers never see a partial pickle
+        with tempfile.NamedTemporaryFile("wb", dir=cache_dir, suffix=".tmp", delete=False) as tmp_fh:
+            pickle.dump((state, obj), tmp_fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_fh.name, cache_fn)
+    except OSError as e:
+        log.debug(f"Could not write cache file '{cache_fn}': {e}")
+    prune_cache_dir(cache_dir)
+
+
 def wait_cli_function(poll_func, refresh_per_second=20):
     """
     Display a command-line spinner while calling a function repeatedly.
@@ -979,18 +1070,19 @@ def get_repo_releases_branches(pipeline, wfs):
             rel_r = gh_api.safe_get(f"https://api.github.com/repos/{pipeline}/releases")
 
             # Check that this repo existed
+            rel_json = json_loads(rel_r.content)
             try:
-                if rel_r.json().get("message") == "Not Found":
+                if rel_json.get("message") == "Not Found":
                     raise AssertionError(f"Not able to find pipeline '{pipeline}'")
             except AttributeError:
                 # Success! We have a list, which doesn't work with .get() which is looking for a dict key
-                wf_releases = list(sorted(rel_r.json(), key=lambda k: k.get("published_at_timestamp", 0), reverse=True))
+                wf_releases = list(sorted(rel_json, key=lambda k: k.get("published_at_timestamp", 0), reverse=True))
 
                 # Get release tag commit hashes
                 if len(wf_releases) > 0:
                     # Get commit hash information for each release
                     tags_r = gh_api.safe_get(f"https://api.github.com/repos/{pipeline}/tags")
-                    for tag in tags_r.json():
+                    for tag in json_loads(tags_r.content):
                         for release in wf_releases:
                             if tag["name"] == release["tag_name"]:
                                 release["tag_sha"] = tag["commit"]["sha"]
@@ -1001,7 +1093,7 @@ def get_repo_releases_branches(pipeline, wfs):
 
     # Get branch information from github api - should be no need to check if the repo exists again
     branch_response = gh_api.safe_get(f"https://api.github.com/repos/{pipeline}/branches")
-    for branch in branch_response.json():
+    for branch in json_loads(branch_response.content):
         if (
             branch["name"] != "TEMPLATE"
             and branch["name"] != "initial_commit"
@@ -1043,8 +1135,8 @@ def load_tools_config(directory: Union[str, Path] = ".") -> Tuple[Path, dict]:
             log.debug(f"No tools config file found: {CONFIG_PATHS[0]}")
         return Path(directory, CONFIG_PATHS[0]), {}
 
-    with open(config_fn) as fh:
-        tools_config = yaml.safe_load(fh)
+    with open(config_fn, "rb") as fh:
+        tools_config = yaml.load(fh, Loader=SafeLoader)
     # If the file is empty
     tools_config = tools_config or {}
 
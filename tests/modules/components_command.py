@@ -0,0 +1,49 @@
+import os
+from pathlib import Path
+
+from nf_core.components.components_command import ComponentCommand
+
+
+def test_components_from_repo_symlink_to_parent(self):
+    """Test that a symlink pointing back to a parent directory is not followed"""
+    tool_dir = os.path.join(self.pipeline_dir, "modules", "nf-core", "tool")
+    os.makedirs(tool_dir)
+    os.symlink("..", os.path.join(tool_dir, "up"))
+    assert sorted(self.mods_remove.components_from_repo("nf-core")) == ["fastqc", "multiqc"]
+
+
+def test_components_from_repo_nested_install(self):
+    """Test that a component installed next to another one is found, although the root directory is unchanged"""
+    repo_dir = Path(self.pipeline_dir, "modules", "nf-core")
+    Path(repo_dir, "samtools", "sort").mkdir(parents=True)
+    Path(repo_dir, "samtools", "sort", "main.nf").touch()
+    assert sorted(self.mods_remove.components_from_repo("nf-core")) == ["fastqc", "multiqc", "samtools/sort"]
+
+    root_mtime = os.stat(repo_dir).st_mtime_ns
+    Path(repo_dir, "samtools", "view").mkdir()
+    Path(repo_dir, "samtools", "view", "main.nf").touch()
+    assert os.stat(repo_dir).st_mtime_ns == root_mtime
+    assert sorted(self.mods_remove.components_from_repo("nf-core")) == [
+        "fastqc",
+        "multiqc",
+        "samtools/sort",
+        "samtools/view",
+    ]
+
+
+def test_components_clone_modules_base_dir_created(self):
+    """Test that the components are found in a base directory that was missing when it was first scanned"""
+    subworkflows_command = ComponentCommand("subworkflows", self.nfcore_modules)
+    assert subworkflows_command.get_components_clone_modules() == []
+
+    Path(self.nfcore_modules, "subworkflows", "nf-core", "bam_sort").mkdir(parents=True)
+    Path(self.nfcore_modules, "subworkflows", "nf-core", "bam_sort", "main.nf").touch()
+    assert subworkflows_command.get_components_clone_modules() == ["bam_sort"]
+
+
+def test_components_from_repo_after_clear_component_dir(self):
+    """Test that a removed component is not found anymore after its directory is cleared"""
+    assert "fastqc" in self.mods_remove.components_from_repo("nf-core")
+    fastqc_dir = os.path.join(self.pipeline_dir, "modules", "nf-core", "fastqc")
+    assert self.mods_remove.clear_component_dir("fastqc", fastqc_dir)
+    assert self.mods_remove.components_from_repo("nf-core") == ["multiqc"]
@@ -1,6 +1,13 @@
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+import yaml
 from rich.console import Console
 
 import nf_core.modules
+from nf_core.components.components_utils import load_yaml_cached
 
 from ..utils import GITLAB_DEFAULT_BRANCH, GITLAB_URL
 
@@ -61,3 +68,53 @@ def test_modules_info_in_modules_repo(self):
     assert "Module: fastqc" in output
     assert "Inputs" in output
     assert "Outputs" in output
+
+
+def test_modules_info_malformed_meta(self):
+    """Test that a meta.yml with a malformed input is only rendered without validation"""
+    meta_fn = Path(self.nfcore_modules, "modules", "nf-core", "bpipe", "test", "meta.yml")
+    with open(meta_fn) as fh:
+        meta = yaml.safe_load(fh)
+    del meta["input"][0]["bam"]["type"]
+    with open(meta_fn, "w") as fh:
+        yaml.dump(meta, fh)
+
+    mods_info = nf_core.modules.ModuleInfo(self.nfcore_modules, "bpipe/test")
+    mods_info.local = True
+    with pytest.raises(UserWarning) as excinfo:
+        mods_info.get_component_info()
+    assert "Missing 'type' for input 'bam'" in str(excinfo.value)
+
+    mods_info = nf_core.modules.ModuleInfo(self.nfcore_modules, "bpipe/test", validate=False)
+    mods_info.local = True
+    console = Console(record=True)
+    console.print(mods_info.get_component_info())
+    assert "Module: bpipe/test" in console.export_text()
+
+
+def test_modules_info_yaml_cache(self):
+    """Test that cached meta.yml contents are refreshed when the file changes"""
+    meta_fn = Path(self.nfcore_modules, "modules", "nf-core", "bpipe", "test", "meta.yml")
+    cache_dir = Path(self.tmp_dir, "cache", "yaml_cache")
+    # An old cache file of another YAML file, which should be pruned
+    old_cache_fn = Path(cache_dir, "old.pkl")
+    cache_dir.mkdir(parents=True)
+    old_cache_fn.touch()
+    os.utime(old_cache_fn, (0, 0))
+
+    meta = load_yaml_cached(meta_fn)
+    assert meta["name"] == "bpipe_test"
+    assert [cache_fn.suffix for cache_fn in cache_dir.iterdir()] == [".pkl"]
+    assert not old_cache_fn.exists()
+    with mock.patch.object(yaml, "load", wraps=yaml.load) as mock_load:
+        assert load_yaml_cached(meta_fn) == meta
+        assert mock_load.call_count == 0
+        # The contents cached by another version of nf-core/tools are parsed again
+        with mock.patch("nf_core.__version__", "0.0.0"):
+            load_yaml_cached(meta_fn)
+        assert mock_load.call_count == 1
+
+    meta["name"] = "bpipe_test_edited"
+    with open(meta_fn, "w") as fh:
+        yaml.dump(meta, fh)
+    assert load_yaml_cached(meta_fn)["name"] == "bpipe_test_edited"
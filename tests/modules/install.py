@@ -1,9 +1,12 @@
 import os
+import stat
 
+import git
 import pytest
 
 from nf_core.modules.install import ModuleInstall
 from nf_core.modules.modules_json import ModulesJson
+from nf_core.modules.modules_repo import ModulesRepo
 
 from ..utils import (
     GITLAB_BRANCH_ORG_PATH_BRANCH,
@@ -93,3 +96,54 @@ def test_modules_install_alternate_remote(self):
     with pytest.raises(Exception) as excinfo:
         install_obj.install("fastqc")
         assert "Could not find a 'main.nf' or 'nextflow.config' file" in str(excinfo.value)
+
+
+def test_modules_install_component_files_from_git_objects(self):
+    """Test that executable files and symbolic links are installed like a copy of the checked out files"""
+    remote_dir = os.path.join(self.tmp_dir, "remote", "links.git")
+    module_dir = os.path.join(remote_dir, "modules", "nf-core", "linked")
+    os.makedirs(os.path.join(module_dir, "resources", "usr", "bin"))
+    os.makedirs(os.path.join(remote_dir, "tests", "data"))
+    with open(os.path.join(remote_dir, ".nf-core.yml"), "w") as fh:
+        fh.writelines(["repository_type: modules", "\n", "org_path: nf-core", "\n"])
+    with open(os.path.join(module_dir, "main.nf"), "w") as fh:
+        fh.write("process LINKED {}\n")
+    script_path = os.path.join(module_dir, "resources", "usr", "bin", "run.sh")
+    with open(script_path, "w") as fh:
+        fh.write("#!/bin/sh\n")
+    os.chmod(script_path, 0o755)
+    with open(os.path.join(remote_dir, "tests", "data", "input.txt"), "w") as fh:
+        fh.write("shared test data\n")
+    # A relative link pointing outside the module directory, and a link to a directory
+    os.symlink("../../../tests/data/input.txt", os.path.join(module_dir, "input.txt"))
+    os.symlink("../../../tests/data", os.path.join(module_dir, "data"))
+    repo = git.Repo.init(remote_dir)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "nf-core")
+        config.set_value("user", "email", "core@nf-co.re")
+    repo.git.add(all=True)
+    repo.git.commit(message="Add linked module")
+
+    modules_repo = ModulesRepo(remote_url=remote_dir)
+    install_dir = os.path.join(self.tmp_dir, "install")
+    assert modules_repo.install_component("linked", install_dir, repo.head.commit.hexsha, "modules")
+
+    umask = os.umask(0)
+    os.umask(umask)
+    installed_script = os.path.join(install_dir, "linked", "resources", "usr", "bin", "run.sh")
+    assert stat.S_IMODE(os.stat(installed_script).st_mode) == 0o777 & ~umask
+    assert stat.S_IMODE(os.stat(os.path.join(install_dir, "linked", "main.nf")).st_mode) == 0o666 & ~umask
+    for installed_file in [["input.txt"], ["data", "input.txt"]]:
+        installed_path = os.path.join(install_dir, "linked", *installed_file)
+        assert not os.path.islink(installed_path)
+        with open(installed_path) as fh:
+            assert fh.read() == "shared test data\n"
+
+    # A link pointing outside the repository can't be installed
+    os.symlink("/etc/hostname", os.path.join(module_dir, "hostname"))
+    repo.git.add(all=True)
+    repo.git.commit(message="Add a link outside the repository")
+    modules_repo.repo.remotes.origin.fetch()
+    assert not modules_repo.install_component(
+        "linked", os.path.join(self.tmp_dir, "install_outside"), repo.head.commit.hexsha, "modules"
+    )
@@ -1,7 +1,9 @@
 import copy
 import json
+import os
 import shutil
 from pathlib import Path
+from unittest import mock
 
 from nf_core.modules.modules_json import ModulesJson
 from nf_core.modules.modules_repo import (
@@ -130,6 +132,65 @@ def test_mod_json_up_to_date(self):
     assert mod_json_before == mod_json_after
 
 
+def test_mod_json_up_to_date_unchanged(self):
+    """
+    Checks that the modules.json file is not checked again
+    while nothing has changed in the pipeline
+    """
+    ModulesJson(self.pipeline_dir).check_up_to_date()
+
+    with mock.patch.object(ModulesJson, "unsynced_components", return_value=([], [], {})) as mock_unsynced:
+        mod_json_obj = ModulesJson(self.pipeline_dir)
+        mod_json_obj.check_up_to_date()
+        assert mock_unsynced.call_count == 0
+        # The file should still be loaded
+        assert mod_json_obj.modules_json is not None
+
+        # Adding a directory changes the state of the pipeline
+        Path(self.pipeline_dir, "modules", NF_CORE_MODULES_NAME, "fastqc", "new_dir").mkdir()
+        ModulesJson(self.pipeline_dir).check_up_to_date()
+        assert mock_unsynced.call_count == 1
+
+        # Editing the main.nf of a subworkflow in place also changes it, as it may include other components
+        with open(
+            Path(self.pipeline_dir, "subworkflows", NF_CORE_MODULES_NAME, "utils_nextflow_pipeline", "main.nf"), "a"
+        ) as fh:
+            fh.write("\n")
+        ModulesJson(self.pipeline_dir).check_up_to_date()
+        assert mock_unsynced.call_count == 2
+
+
+def test_mod_json_up_to_date_saved_state(self):
+    """
+    Checks that the state of the pipeline after check_up_to_date() is saved to the
+    cache directory, and skips the check in a new session while nothing has changed
+    """
+    cache_key = os.path.abspath(self.pipeline_dir)
+    state_fn = ModulesJson.pipeline_state_path(cache_key)
+    assert state_fn.parent == Path(self.tmp_dir, "cache", "modules_json_state")
+    # An old saved state of another pipeline, which should be pruned
+    old_state_fn = Path(state_fn.parent, "old.pkl")
+    old_state_fn.parent.mkdir(parents=True)
+    old_state_fn.touch()
+    os.utime(old_state_fn, (0, 0))
+
+    ModulesJson(self.pipeline_dir).check_up_to_date()
+    assert state_fn.exists()
+    assert not old_state_fn.exists()
+
+    with mock.patch.object(ModulesJson, "unsynced_components", return_value=([], [], {})) as mock_unsynced:
+        # Forget the state of this session, so that it is loaded from the saved file
+        ModulesJson.up_to_date_cache.pop(cache_key)
+        ModulesJson(self.pipeline_dir).check_up_to_date()
+        assert mock_unsynced.call_count == 0
+
+        # A state saved by another version of nf-core/tools is ignored
+        ModulesJson.up_to_date_cache.pop(cache_key)
+        with mock.patch("nf_core.__version__", "0.0.0"):
+            ModulesJson(self.pipeline_dir).check_up_to_date()
+        assert mock_unsynced.call_count == 1
+
+
 def test_mod_json_up_to_date_module_removed(self):
     """
     Reinstall a module that has an entry in the modules.json
@@ -20,3 +20,16 @@ def test_modules_remove_multiqc_from_gitlab(self):
     module_path = os.path.join(self.mods_install_gitlab.dir, "modules", "nf-core-test", "multiqc")
     assert self.mods_remove_gitlab.remove("multiqc", force=True)
     assert os.path.exists(module_path) is False
+
+
+def test_modules_remove_symlinked_dir(self):
+    """Test that removing a symlinked module directory doesn't empty the link target"""
+    target_dir = os.path.join(self.tmp_dir, "symlink_target")
+    os.makedirs(target_dir)
+    target_file = os.path.join(target_dir, "main.nf")
+    with open(target_file, "w") as fh:
+        fh.write("")
+    module_path = os.path.join(self.pipeline_dir, "modules", "nf-core", "symlinked")
+    os.symlink(target_dir, module_path)
+    assert self.mods_remove.clear_component_dir("symlinked", module_path) is False
+    assert os.path.exists(target_file)
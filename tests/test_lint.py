@@ -12,7 +12,7 @@ import yaml
 import nf_core.create
 import nf_core.lint
 
-from .utils import with_temporary_folder
+from .utils import patch_nfcore_cache_dir, with_temporary_folder
 
 
 class TestLint(unittest.TestCase):
@@ -25,6 +25,7 @@ class TestLint(unittest.TestCase):
         """
 
         self.tmp_dir = tempfile.mkdtemp()
+        patch_nfcore_cache_dir(self, os.path.join(self.tmp_dir, "cache"))
         self.test_pipeline_dir = os.path.join(self.tmp_dir, "nf-core-testpipeline")
         self.create_obj = nf_core.create.PipelineCreate(
             "testpipeline", "This is a test pipeline", "Test McTestFace", outdir=self.test_pipeline_dir, plain=True
@@ -23,6 +23,7 @@ from .utils import (
     create_tmp_pipeline,
     mock_anaconda_api_calls,
     mock_biocontainers_api_calls,
+    patch_nfcore_cache_dir,
 )
 
 
@@ -99,6 +100,7 @@ class TestModules(unittest.TestCase):
 
         # Set up the schema
         self.tmp_dir, self.template_dir, self.pipeline_name, self.pipeline_dir = create_tmp_pipeline()
+        patch_nfcore_cache_dir(self, os.path.join(self.tmp_dir, "cache"))
         # Set up install objects
         self.mods_install = nf_core.modules.ModuleInstall(self.pipeline_dir, prompt=False, force=True)
         self.mods_install_old = nf_core.modules.ModuleInstall(
@@ -165,6 +167,12 @@ class TestModules(unittest.TestCase):
         test_modules_bump_versions_fail_unknown_version,
         test_modules_bump_versions_single_module,
     )
+    from .modules.components_command import (  # type: ignore[misc]
+        test_components_clone_modules_base_dir_created,
+        test_components_from_repo_after_clear_component_dir,
+        test_components_from_repo_nested_install,
+        test_components_from_repo_symlink_to_parent,
+    )
     from .modules.create import (  # type: ignore[misc]
         test_modules_create_fail_exists,
         test_modules_create_nfcore_modules,
@@ -177,11 +185,14 @@ class TestModules(unittest.TestCase):
     from .modules.info import (  # type: ignore[misc]
         test_modules_info_in_modules_repo,
         test_modules_info_local,
+        test_modules_info_malformed_meta,
         test_modules_info_remote,
         test_modules_info_remote_gitlab,
+        test_modules_info_yaml_cache,
     )
     from .modules.install import (  # type: ignore[misc]
         test_modules_install_alternate_remote,
+        test_modules_install_component_files_from_git_objects,
         test_modules_install_different_branch_fail,
         test_modules_install_different_branch_succeed,
         test_modules_install_emptypipeline,
@@ -250,6 +261,8 @@ class TestModules(unittest.TestCase):
         test_mod_json_up_to_date,
         test_mod_json_up_to_date_module_removed,
         test_mod_json_up_to_date_reinstall_fails,
+        test_mod_json_up_to_date_saved_state,
+        test_mod_json_up_to_date_unchanged,
         test_mod_json_update,
         test_mod_json_with_empty_modules_value,
         test_mod_json_with_missing_modules_entry,
@@ -265,6 +278,7 @@ class TestModules(unittest.TestCase):
     )
     from .modules.remove import (  # type: ignore[misc]
         test_modules_remove_multiqc_from_gitlab,
+        test_modules_remove_symlinked_dir,
         test_modules_remove_trimgalore,
         test_modules_remove_trimgalore_uninstalled,
     )
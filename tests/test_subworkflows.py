@@ -16,6 +16,7 @@ from .utils import (
     GITLAB_URL,
     OLD_SUBWORKFLOWS_SHA,
     create_tmp_pipeline,
+    patch_nfcore_cache_dir,
 )
 
 
@@ -63,6 +64,7 @@ class TestSubworkflows(unittest.TestCase):
 
         # Set up the pipeline structure
         self.tmp_dir, self.template_dir, self.pipeline_name, self.pipeline_dir = create_tmp_pipeline()
+        patch_nfcore_cache_dir(self, os.path.join(self.tmp_dir, "cache"))
         # Set up the nf-core/modules repo dummy
         self.nfcore_modules = create_modules_repo_dummy(self.tmp_dir)
 
@@ -5,7 +5,9 @@ Helper functions for tests
 import functools
 import os
 import tempfile
+import unittest
 from typing import Any, Callable, Tuple
+from unittest import mock
 
 import responses
 
@@ -28,6 +30,16 @@ GITLAB_BRANCH_TEST_NEW_SHA = "7d73e21f30041297ea44367f2b4fd4e045c0b991"
 GITLAB_NFTEST_BRANCH = "nf-test-tests-self-hosted-runners"
 
 
+def patch_nfcore_cache_dir(test_case: unittest.TestCase, cache_dir: str) -> None:
+    """
+    Point the nf-core cache directory at `cache_dir` until the end of the test,
+    so that the files cached by the test don't end up in the cache of the user
+    """
+    patcher = mock.patch("nf_core.utils.NFCORE_CACHE_DIR", cache_dir)
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
+
+
 def with_temporary_folder(func: Callable[..., Any]) -> Callable[..., Any]:
     """
     Call the decorated function under the tempfile.TemporaryDirectory